@@ -153,28 +153,37 @@ class Text2Speech:
                 logger.error(f"Failed to initialize Kokoro ONNX engine: {e}")
                 raise
     
-    def synthesize_to_file(self, text: str, output_path: str) -> str:
+    def synthesize_to_file(self, text: str, output_path: str,
+                           voice: Optional[str] = None, speed: Optional[float] = None,
+                           slow: Optional[bool] = None) -> str:
         """
         Synthesize text to speech and save to a file.
         
         Args:
             text: Text to synthesize
             output_path: Path where to save the audio file
+            voice: Per-call voice override (Kokoro engines)
+            speed: Per-call speed override (Kokoro engines)
+            slow: Per-call slow-speech override (gTTS)
             
         Returns:
             Path to the generated audio file
+        
+        The overrides default to the instance settings; passing them per
+        call keeps a shared/pooled instance immutable, so concurrent
+        requests can't pick up each other's voice or speed.
         """
         try:
             logger.info(f"Synthesizing text to file: {output_path}")
             
             if self.engine == "gtts":
-                return self._gtts_to_file(text, output_path)
+                return self._gtts_to_file(text, output_path, slow=slow)
             elif self.engine == "pyttsx3":
                 return self._pyttsx3_to_file(text, output_path)
             elif self.engine == "kokoro":
-                return self._kokoro_to_file(text, output_path)
+                return self._kokoro_to_file(text, output_path, voice=voice, speed=speed)
             elif self.engine == "kokoro-onnx":
-                return self._kokoro_onnx_to_file(text, output_path)
+                return self._kokoro_onnx_to_file(text, output_path, voice=voice, speed=speed)
             else:
                 raise ValueError(f"Unknown engine: {self.engine}")
                 
@@ -182,12 +191,17 @@ class Text2Speech:
             logger.error(f"Error synthesizing text to file: {e}")
             raise
     
-    def synthesize_to_bytes(self, text: str) -> bytes:
+    def synthesize_to_bytes(self, text: str,
+                            voice: Optional[str] = None, speed: Optional[float] = None,
+                            slow: Optional[bool] = None) -> bytes:
         """
         Synthesize text to speech and return as bytes.
         
         Args:
             text: Text to synthesize
+            voice: Per-call voice override (Kokoro engines)
+            speed: Per-call speed override (Kokoro engines)
+            slow: Per-call slow-speech override (gTTS)
             
         Returns:
             Audio data as bytes
@@ -196,13 +210,13 @@ class Text2Speech:
             logger.info("Synthesizing text to bytes")
             
             if self.engine == "gtts":
-                return self._gtts_to_bytes(text)
+                return self._gtts_to_bytes(text, slow=slow)
             elif self.engine == "pyttsx3":
                 return self._pyttsx3_to_bytes(text)
             elif self.engine == "kokoro":
-                return self._kokoro_to_bytes(text)
+                return self._kokoro_to_bytes(text, voice=voice, speed=speed)
             elif self.engine == "kokoro-onnx":
-                return self._kokoro_onnx_to_bytes(text)
+                return self._kokoro_onnx_to_bytes(text, voice=voice, speed=speed)
             else:
                 raise ValueError(f"Unknown engine: {self.engine}")
                 
@@ -210,7 +224,8 @@ class Text2Speech:
             logger.error(f"Error synthesizing text to bytes: {e}")
             raise
     
-    def _kokoro_to_file(self, text: str, output_path: str) -> str:
+    def _kokoro_to_file(self, text: str, output_path: str,
+                        voice: Optional[str] = None, speed: Optional[float] = None) -> str:
         """Generate speech using Kokoro and save to file"""
         try:
             if self.kokoro_pipeline is None:
@@ -219,7 +234,11 @@ class Text2Speech:
             logger.info(f"Generating Kokoro TTS for text: {text[:50]}...")
             
             # Generate audio using Kokoro
-            generator = self.kokoro_pipeline(text, voice=self.voice, speed=self.speed)
+            generator = self.kokoro_pipeline(
+                text,
+                voice=self.voice if voice is None else voice,
+                speed=self.speed if speed is None else speed,
+            )
             
             # Kokoro returns a generator, we need to collect all audio chunks
             audio_chunks = []
@@ -242,7 +261,8 @@ class Text2Speech:
             logger.error(f"Kokoro error: {e}")
             raise
     
-    def _kokoro_to_bytes(self, text: str) -> bytes:
+    def _kokoro_to_bytes(self, text: str,
+                         voice: Optional[str] = None, speed: Optional[float] = None) -> bytes:
         """Generate speech using Kokoro and return as bytes"""
         try:
             # Use a temporary file approach for Kokoro
@@ -251,7 +271,7 @@ class Text2Speech:
             
             try:
                 # Generate to temp file
-                self._kokoro_to_file(text, temp_path)
+                self._kokoro_to_file(text, temp_path, voice=voice, speed=speed)
                 
                 # Read the file as bytes
                 with open(temp_path, 'rb') as f:
@@ -270,7 +290,8 @@ class Text2Speech:
             logger.error(f"Kokoro error: {e}")
             raise
     
-    def _kokoro_onnx_to_file(self, text: str, output_path: str) -> str:
+    def _kokoro_onnx_to_file(self, text: str, output_path: str,
+                             voice: Optional[str] = None, speed: Optional[float] = None) -> str:
         """Generate speech using Kokoro ONNX and save to file"""
         try:
             if self.kokoro_onnx is None:
@@ -279,7 +300,11 @@ class Text2Speech:
             logger.info(f"Generating Kokoro ONNX TTS for text: {text[:50]}...")
             
             # Generate audio using Kokoro ONNX
-            audio = self.kokoro_onnx.generate(text, voice=self.voice, speed=self.speed)
+            audio = self.kokoro_onnx.generate(
+                text,
+                voice=self.voice if voice is None else voice,
+                speed=self.speed if speed is None else speed,
+            )
             
             # Save to file
             sf.write(output_path, audio, 24000)
@@ -290,7 +315,8 @@ class Text2Speech:
             logger.error(f"Kokoro ONNX error: {e}")
             raise
     
-    def _kokoro_onnx_to_bytes(self, text: str) -> bytes:
+    def _kokoro_onnx_to_bytes(self, text: str,
+                              voice: Optional[str] = None, speed: Optional[float] = None) -> bytes:
         """Generate speech using Kokoro ONNX and return as bytes"""
         try:
             # Use a temporary file approach for Kokoro ONNX
@@ -299,7 +325,7 @@ class Text2Speech:
             
             try:
                 # Generate to temp file
-                self._kokoro_onnx_to_file(text, temp_path)
+                self._kokoro_onnx_to_file(text, temp_path, voice=voice, speed=speed)
                 
                 # Read the file as bytes
                 with open(temp_path, 'rb') as f:
@@ -318,10 +344,12 @@ class Text2Speech:
             logger.error(f"Kokoro ONNX error: {e}")
             raise
     
-    def _gtts_to_file(self, text: str, output_path: str) -> str:
+    def _gtts_to_file(self, text: str, output_path: str,
+                      slow: Optional[bool] = None) -> str:
         """Generate speech using gTTS and save to file"""
         try:
-            tts = gTTS(text=text, lang=self.language, slow=self.slow)
+            tts = gTTS(text=text, lang=self.language,
+                       slow=self.slow if slow is None else slow)
             tts.save(output_path)
             logger.info(f"gTTS audio saved to: {output_path}")
             return output_path
@@ -329,10 +357,11 @@ class Text2Speech:
             logger.error(f"gTTS error: {e}")
             raise
     
-    def _gtts_to_bytes(self, text: str) -> bytes:
+    def _gtts_to_bytes(self, text: str, slow: Optional[bool] = None) -> bytes:
         """Generate speech using gTTS and return as bytes"""
         try:
-            tts = gTTS(text=text, lang=self.language, slow=self.slow)
+            tts = gTTS(text=text, lang=self.language,
+                       slow=self.slow if slow is None else slow)
             
             # Use BytesIO to get the audio data as bytes
             audio_buffer = io.BytesIO()
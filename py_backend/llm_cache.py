@@ -0,0 +1,74 @@
+"""
+Response cache for expensive LightRAG query calls
+
+An rag.aquery call costs graph retrieval plus a full LLM generation, so a
+repeat of an identical prompt dominates every local optimization the
+endpoints can make. This module keeps an in-process LRU with TTL expiry,
+keyed by the normalized prompt plus a caller-supplied version tag (the
+notebook's docs fingerprint), so any document change naturally invalidates
+all of a notebook's entries without explicit bookkeeping.
+
+Pure stdlib on purpose: an embedding-similarity ("semantic") match layer
+would pull in FAISS/diskcache-sized dependencies for marginal extra hit
+rate over exact normalized-prompt matching on this traffic.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+CacheKey = Tuple[str, str, str, str, str]
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace and case so trivially reformatted prompts share a key"""
+    return ' '.join(prompt.split()).lower()
+
+
+class LLMResponseCache:
+    """LRU + TTL cache for LLM answers keyed by prompt identity"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(notebook_id: str, mode: str, prompt: str,
+                 version: str = "", extra: str = "") -> CacheKey:
+        """Build a cache key from the query identity
+
+        version should change whenever the notebook's documents change
+        (the docs fingerprint); extra carries request knobs that alter the
+        answer (top_k, response type, summary length, ...).
+        """
+        digest = hashlib.blake2b(
+            normalize_prompt(prompt).encode('utf-8'), digest_size=16
+        ).hexdigest()
+        return (notebook_id, mode, digest, version, extra)
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Return the cached value for key, or None if absent/expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        """Store a value, evicting least-recently-used entries past maxsize"""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate_notebook(self, notebook_id: str) -> None:
+        """Drop every entry belonging to one notebook"""
+        stale = [key for key in self._entries if key[0] == notebook_id]
+        for key in stale:
+            del self._entries[key]